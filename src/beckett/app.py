@@ -1,4 +1,5 @@
 import flask
+import jinja2
 import structlog
 
 from src import settings
@@ -16,12 +17,28 @@ class BeckettApp(flask.Flask):
         ), "template_folder must be set for Beckett to work with Flask"
         super().__init__(*args, **kwargs)
 
+        # Outside development templates never change, so don't check them for changes on every render, and keep every
+        # compiled template (cache_size=-1) instead of Jinja's default LRU so a large app doesn't recompile them.
+        self.config["TEMPLATES_AUTO_RELOAD"] = settings.in_dev_environment
+        if not settings.in_dev_environment:
+            self.jinja_options = {**self.jinja_options, "cache_size": -1}
+
+    def precompile_templates(self, *templates: str) -> None:
+        """Compile templates into the Jinja cache up front so the first request doesn't pay for it."""
+        for template in templates:
+            try:
+                self.jinja_env.get_template(template)
+            except jinja2.TemplateNotFound:
+                log.warning("Template not found, not precompiling", template=template)
+
     def run(self, *args, **kwargs):
         # Only generate TS types files in development
         if settings.in_dev_environment:
+            from src.beckett.blueprint import write_pending_page_files
             from src.beckett.types.types_manager import api_route_type_manager
 
             api_route_type_manager.write_types()
+            write_pending_page_files()
 
             log.info(f"URLs: {self.url_map}")
 
@@ -1,21 +1,116 @@
-import re
 import typing
-from functools import wraps
+from functools import cached_property, lru_cache, wraps
 
 import flask
 import structlog
-
-from src.beckett.renderer.typescript_react.renderer import (
+from jinja2.utils import htmlsafe_json_dumps
+from markupsafe import Markup
+from pydantic import BaseModel
+
+from src import settings
+from src.app import app
+from src.beckett.renderer.html.renderer import (
+    HTML_HEADERS,
     build_render_context_for_base_template,
+)
+from src.beckett.renderer.typescript_react.renderer import (
+    queue_typescript_file,
+    write_pending_typescript_files,
     write_react_page_file,
-    write_typescript_file,
 )
 from src.beckett.types import NoneType, generate_interfaces
-from src.beckett.types.types_manager import generate_api_decorator
+from src.beckett.types.types_manager import (
+    api_route_type_manager,
+    generate_api_decorator,
+)
 
 log = structlog.get_logger(__name__)
 
 
+def _is_strict_props_annotation(
+    annotation: typing.Any, seen: typing.FrozenSet[type]
+) -> bool:
+    """Whether values of a props field are always of a single type whose equality implies identical JSON."""
+    if annotation in (str, int, bool, NoneType):
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _is_strict_props_model(annotation, seen)
+    if typing.get_origin(annotation) is typing.Union:
+        # Only Optional[X]; other unions can mix types that compare equal, like int | bool.
+        args = typing.get_args(annotation)
+        return (
+            len(args) == 2
+            and NoneType in args
+            and all(_is_strict_props_annotation(a, seen) for a in args)
+        )
+    return False
+
+
+def _is_strict_props_model(
+    cls: typing.Type[BaseModel], seen: typing.FrozenSet[type]
+) -> bool:
+    if cls in seen:
+        # Self-referencing models are only as strict as the rest of their fields.
+        return True
+    if not cls.model_config.get("frozen") or cls.model_config.get("extra") == "allow":
+        return False
+    return all(
+        _is_strict_props_annotation(field_info.annotation, seen | {cls})
+        for field_info in cls.model_fields.values()
+    )
+
+
+@lru_cache(maxsize=None)
+def _props_are_cacheable(cls: typing.Type[BaseModel]) -> bool:
+    """
+    Whether the serialized props of this class can be cached, keyed on the props themselves.
+
+    Caching relies on the model's hash and ==, which only implies identical JSON when the model is frozen and every
+    field holds exactly one type: pydantic compares field values with ==, and 1 == True == 1.0.
+    """
+    return _is_strict_props_model(cls, frozenset())
+
+
+@lru_cache(maxsize=None)
+def _render_page_props_interfaces(return_type: typing.Any) -> str:
+    """
+    Render the contents of the typescript type file for a page's props class.
+
+    Cached per class, so endpoints sharing a props class only generate the interfaces once.
+    """
+    typescript_imports, typescript_interfaces = generate_interfaces(
+        return_type, name="PageProps", default_export=True
+    )
+
+    export_string = "// This file is generated by @beckett.page(), changes will be overwritten if the server is running in development mode\n\n"  # noqa
+
+    if typescript_imports:
+        export_string += typescript_imports.render()
+        export_string += "\n"
+
+    export_string += typescript_interfaces.render()
+
+    return export_string.strip() + "\n"
+
+
+_pending_pages: typing.List["BeckettBlueprint.page"] = []
+
+
+def write_pending_page_files() -> None:
+    """
+    Write the React page and typescript type files for every @beckett.page() endpoint.
+
+    Called when the development server starts rather than as each endpoint is decorated.
+    """
+    pages = list(_pending_pages)
+    _pending_pages.clear()
+
+    for page in pages:
+        page._write_typescript_type_file()
+
+    write_pending_typescript_files()
+
+
 class BeckettBlueprint(flask.Blueprint):
     """
     Handles the strong-linking between Flask view functions
@@ -50,16 +145,26 @@ class BeckettBlueprint(flask.Blueprint):
             self.template = "beckett_page.jinja2"
 
         def __call__(self, view_function):
-            from src.beckett.types.types_manager import api_route_type_manager
-
             self.view_function = view_function
-            self.view_function_types = typing.get_type_hints(self.view_function)
-            self.return_type = self.view_function_types.pop("return", None)
-            self.module = re.sub(r".*\.", "", view_function.__module__)
+            self.module = view_function.__module__.rpartition(".")[2]
             self.name = view_function.__name__
+            self._dump_props = lru_cache(maxsize=128)(self._model_dump_json)
+            self._entrypoint_filename = f"src/js/template/{self.module}/{self.name}.tsx"
+            self._static_react_context = {
+                "react_entrypoint_filename": self._entrypoint_filename,
+            }
+
+            app.precompile_templates(self.template, "base.jinja2")
 
-            # At server start, write out the typescript type file for the props, if the view function returns them.
-            self._write_typescript_type_file()
+            # Generating the typescript files for the props only happens in development, and is left until the
+            # server starts (see write_pending_page_files) so importing the views stays cheap.
+            if settings.in_dev_environment:
+                _pending_pages.append(self)
+
+            # Bound here so the request path looks them up in the closure rather than through globals and attributes.
+            render = flask.render_template
+            serialize = self._serialize_props
+            base_ctx = build_render_context_for_base_template
 
             @wraps(view_function)
             def wrapped(*args, **kwargs):
@@ -69,28 +174,50 @@ class BeckettBlueprint(flask.Blueprint):
                 """
                 response = view_function(*args, **kwargs)
 
-                react_context = {
-                    "react_entrypoint_filename": f"src/js/template/{self.module}/{self.name}.tsx",
-                    "base_data": {
-                        "urlMap": api_route_type_manager.get_url_map(),
-                    },
+                # Build the whole render context in one dict, rather than merging several through kwargs.
+                ctx = {
+                    "__render_react_response": response,
+                    "props": serialize(response),
                 }
+                ctx.update(base_ctx())
+                ctx.update(self._static_react_context)
+                ctx["base_data"] = self._get_base_data()
+
+                html = render(self.template, **ctx)
+                return html, 200, HTML_HEADERS
 
-                html = flask.render_template(
-                    self.template,
-                    __render_react_response=response,
-                    props=response.model_dump_json(),
-                    **build_render_context_for_base_template(),
-                    **react_context,
+            return wrapped
+
+        @staticmethod
+        def _get_base_data() -> Markup:
+            """Return the page's base data as template-ready JSON, built once per process.
+
+            The url map only depends on the registered routes, which are all in place before the first request.
+            """
+            extensions = flask.current_app.extensions
+            base_data = extensions.get("beckett_base_data")
+            if base_data is None:
+                base_data = htmlsafe_json_dumps(
+                    {"urlMap": api_route_type_manager.get_url_map()}
                 )
-                status = 200
-                headers = {
-                    "Content-Type": "text/html; charset=utf-8",
-                }
+                extensions["beckett_base_data"] = base_data
+            return base_data
 
-                return html, status, headers
+        @staticmethod
+        def _model_dump_json(response) -> Markup:
+            # pydantic produces the JSON, which the page then receives as a string literal to JSON.parse.
+            return htmlsafe_json_dumps(response.model_dump_json())
 
-            return wrapped
+        def _serialize_props(self, response: BaseModel) -> Markup:
+            """Serialize the props for the page, reusing previous output for identical props where that is safe."""
+            if _props_are_cacheable(type(response)):
+                return self._dump_props(response)
+            return self._model_dump_json(response)
+
+        @cached_property
+        def return_type(self) -> typing.Any:
+            """The view function's return annotation, only resolved when the typescript files are generated."""
+            return typing.get_type_hints(self.view_function).get("return", None)
 
         def _write_typescript_type_file(self):
             if self.return_type == NoneType:
@@ -100,26 +227,14 @@ class BeckettBlueprint(flask.Blueprint):
                 f"@beckett.page())."
             )
             write_react_page_file(module=self.module, endpoint=self.name)
-            write_typescript_file(
+            queue_typescript_file(
                 type_data=self._generate_typescript_type_file_contents(),
                 module=self.module,
                 endpoint=self.name,
             )
 
         def _generate_typescript_type_file_contents(self) -> str:
-            typescript_imports, typescript_interfaces = generate_interfaces(
-                self.return_type, name="PageProps", default_export=True
-            )
-
-            export_string = "// This file is generated by @beckett.page(), changes will be overwritten if the server is running in development mode\n\n"  # noqa
-
-            if typescript_imports:
-                export_string += typescript_imports.render()
-                export_string += "\n"
-
-            export_string += typescript_interfaces.render()
-
-            return export_string.strip() + "\n"
+            return _render_page_props_interfaces(self.return_type)
 
     def api_get(self, rule, *, endpoint=None, **options):
         if "methods" in options:
@@ -1,38 +1,114 @@
 import typing
-from functools import wraps
+from functools import lru_cache, wraps
 
 import flask
 import structlog
 
 from src import settings
+from src.app import app
 from src.utils import unwrap
 
 log = structlog.getLogger(__name__)
 
+# Shared by every HTML response; Flask copies these into each response's own Headers.
+HTML_HEADERS = {
+    "Content-Type": "text/html; charset=utf-8",
+}
 
-def _build_render_context_for_base_template() -> typing.Dict[str, typing.Any]:
+
+# The blueprint and endpoint names are fixed once the app is built, so their html ids are only derived once.
+_BLUEPRINT_CLASS_CACHE: typing.Dict[str, str] = {}
+_ENDPOINT_ID_CACHE: typing.Dict[str, str] = {}
+
+
+def build_render_context_for_base_template() -> typing.Dict[str, typing.Any]:
     """
     Return the render context required for base.jinja2
-    """
-    blueprint_id = unwrap(flask.request.blueprint).replace(".", "-")
-
-    html_classes = [f"blueprint-{blueprint_id}"]
 
-    return {
+    The context only depends on the current request, so it is built once and kept in the request's WSGI environ
+    (flask.g outlives the request when an app context is already pushed).
+    """
+    request = flask.request
+    ctx = request.environ.get("beckett.base_template_ctx")
+    if ctx is not None:
+        return ctx
+
+    blueprint = unwrap(request.blueprint)
+    blueprint_class = _BLUEPRINT_CLASS_CACHE.get(blueprint)
+    if blueprint_class is None:
+        blueprint_class = f"blueprint-{blueprint.replace('.', '-')}"
+        _BLUEPRINT_CLASS_CACHE[blueprint] = blueprint_class
+
+    endpoint = unwrap(request.endpoint)
+    html_id = _ENDPOINT_ID_CACHE.get(endpoint)
+    if html_id is None:
+        html_id = f"endpoint-{endpoint.replace('.', '-')}"
+        _ENDPOINT_ID_CACHE[endpoint] = html_id
+
+    html_classes = [blueprint_class]
+
+    ctx = {
         "html_classes": html_classes,
-        "html_id": f"endpoint-{unwrap(flask.request.endpoint).replace('.', '-')}",
+        "html_id": html_id,
         "is_development": settings.in_dev_environment,
     }
+    request.environ["beckett.base_template_ctx"] = ctx
+    return ctx
+
+
+@lru_cache(maxsize=32)
+def _render_empty_html(template: str, endpoint: str) -> str:
+    """
+    Render a template for a view that returned no context, once per template and endpoint.
+
+    Only used for views declared with render_html(cache_empty=True): the author is promising the template doesn't use
+    anything request specific (request, session, g, query args, CSRF tokens...), which we have no way to check.
+    """
+    return flask.render_template(template, **build_render_context_for_base_template())
+
+
+def _can_use_cached_empty_html(
+    response: typing.Dict[str, typing.Any],
+    g: typing.Any,
+    session: typing.Any,
+) -> bool:
+    """
+    Whether the response of a cache_empty view can be served from _render_empty_html.
+
+    Extra context on flask.g or pending flashed messages still make the page vary per request, which rules it out, as
+    does development, where templates are expected to change under us.
+    """
+    return (
+        response == {}
+        and not settings.in_dev_environment
+        and not g.__dict__.get("context")
+        and "_flashes" not in session
+    )
 
 
 class render_html:
     def __init__(
         self,
         template=None,
+        cache_empty=False,
     ):
         self.template = template
+        # Opt in to rendering the page once when the view returns {}. Only safe for templates that don't use
+        # anything request specific.
+        self.cache_empty = cache_empty
 
     def __call__(self, f, template=None):
+        directory = "/".join(f.__module__.split(".")[2:])
+        default_template = f"/{directory}/{f.__name__}.jinja2"
+        app.precompile_templates(self.template or default_template, "base.jinja2")
+
+        # Bound here so the request path looks them up in the closure rather than through module globals.
+        render = flask.render_template
+        base_ctx = build_render_context_for_base_template
+        request = flask.request
+        g = flask.g
+        session = flask.session
+
         @wraps(f)
         def wrapped(*args, **kwargs):
             response = f(*args, **kwargs)
@@ -40,26 +116,23 @@ class render_html:
             if not isinstance(response, dict):
                 return response
 
-            template = self.template
-
-            if template is None:
-                directory = "/".join(f.__module__.split(".")[2:])
-                template = f"/{directory}/{f.__name__}.jinja2"
+            template = self.template or default_template
 
-            log.info(f"Looking for {template}...")
+            log.info("Looking for template", template=template)
 
-            out = flask.render_template(
-                template,
-                **response,
-                **_build_render_context_for_base_template(),
-                **getattr(flask.g, "context", {}),
-            )
+            if self.cache_empty and _can_use_cached_empty_html(response, g, session):
+                out = _render_empty_html(template, unwrap(request.endpoint))
+            else:
+                ctx = dict(response)
+                ctx.update(base_ctx())
+                # Reading g's __dict__ directly skips its attribute lookup machinery, and most requests have no
+                # extra context to merge at all.
+                g_ctx = g.__dict__.get("context")
+                if g_ctx:
+                    ctx.update(g_ctx)
 
-            status = 200
-            headers = {
-                "Content-Type": "text/html; charset=utf-8",
-            }
+                out = render(template, **ctx)
 
-            return out, status, headers
+            return out, 200, HTML_HEADERS
 
         return wrapped
@@ -1,32 +1,27 @@
 from __future__ import annotations
 
 import typing
-from os.path import exists
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-import flask
 import structlog
 
 from src import settings
 from src.app import app
-from src.utils import unwrap
 
 log = structlog.getLogger(__name__)
 
+_pending_typescript_files: typing.List[typing.Dict[str, typing.Any]] = []
 
-def build_render_context_for_base_template() -> typing.Dict[str, typing.Any]:
+
+@lru_cache(maxsize=None)
+def _read_react_page_template() -> str:
     """
-    Return the render context required for base.jinja2
+    Return the contents of the template used for new React page components, reading it from disk only once.
     """
-    blueprint_id = unwrap(flask.request.blueprint).replace(".", "-")
-
-    html_classes = [f"blueprint-{blueprint_id}"]
-
-    return {
-        "html_classes": html_classes,
-        "html_id": f"endpoint-{unwrap(flask.request.endpoint).replace('.', '-')}",
-        "is_development": settings.in_dev_environment,
-    }
+    template_path = Path(app.root_path) / "template" / "beckett_page.template"
+    return template_path.read_bytes().decode("utf-8")
 
 
 def write_react_page_file(module: str, endpoint: str) -> None:
@@ -39,24 +34,32 @@ def write_react_page_file(module: str, endpoint: str) -> None:
     react_page_file_path = (
         Path(app.root_path) / "js" / "template" / module / f"{endpoint}.tsx"
     )
-    template_path = Path(app.root_path) / "template" / "beckett_page.template"
 
-    if not exists(react_page_file_path):
-        log.info(
-            "Creating new beckett page for this endpoint",
-            module=module,
-            endpoint=endpoint,
-            filename=str(react_page_file_path),
-        )
-        with template_path.resolve().open("r") as template_file:
-            template_file_content = template_file.read()
-            template_file_content = template_file_content.replace(
+    # Opening with "x" (O_CREAT | O_EXCL) checks the page doesn't exist and creates it in a single call.
+    try:
+        new_file = react_page_file_path.open("xb")
+    except FileExistsError:
+        return
+    except FileNotFoundError:
+        react_page_file_path.parent.mkdir(exist_ok=True)
+        new_file = react_page_file_path.open("xb")
+
+    log.info(
+        "Creating new beckett page for this endpoint",
+        module=module,
+        endpoint=endpoint,
+        filename=str(react_page_file_path),
+    )
+    try:
+        with new_file:
+            template_file_content = _read_react_page_template().replace(
                 "{{endpoint}}", endpoint
             )
-        react_page_file_path.parent.mkdir(exist_ok=True)
-        with react_page_file_path.resolve().open("w+") as new_file:
-            new_file.write(template_file_content)
-    return
+            new_file.write(template_file_content.encode("utf-8"))
+    except BaseException:
+        # Don't leave an empty page behind, or the next start would think the page already exists.
+        react_page_file_path.unlink(missing_ok=True)
+        raise
 
 
 def write_typescript_file(
@@ -81,13 +84,15 @@ def write_typescript_file(
         Path(app.root_path) / "js" / "template" / module / f"{endpoint}.type.ts"
     ).resolve()
     try:
-        with typescript_file_path.open() as fh:
-            existing_type_data = fh.read()
+        existing_type_data: typing.Optional[bytes] = typescript_file_path.read_bytes()
     except IOError:
         existing_type_data = None
 
-    if type_data != existing_type_data:
-        if type_data:
+    # Compare the raw bytes so the existing file doesn't need decoding.
+    new_type_data = type_data.encode("utf-8") if type_data is not None else None
+
+    if new_type_data != existing_type_data:
+        if new_type_data:
             log.info(
                 "writing new type data",
                 module=module,
@@ -98,8 +103,7 @@ def write_typescript_file(
             # Create the directory if it's not already there.
             typescript_file_path.parent.mkdir(exist_ok=True)
 
-            with typescript_file_path.open("w") as fh:
-                fh.write(type_data)
+            typescript_file_path.write_bytes(new_type_data)
         else:
             log.info(
                 "removing type data",
@@ -114,3 +118,35 @@ def write_typescript_file(
             # case we'd rather not even try if we have even an inkling that there might still be a file in there.
             if any(typescript_file_path.parent.iterdir()):
                 typescript_file_path.parent.rmdir()
+
+
+def queue_typescript_file(
+    *,
+    module: str,
+    endpoint: str,
+    type_data: typing.Optional[str],
+) -> None:
+    """Queue typing data to be written by write_pending_typescript_files.
+
+    Decorated endpoints queue their type files at import time so they can all be written in one go when the server
+    starts, rather than one at a time as each module is imported.
+    """
+    if not settings.in_dev_environment:
+        return
+
+    _pending_typescript_files.append(
+        dict(module=module, endpoint=endpoint, type_data=type_data)
+    )
+
+
+def write_pending_typescript_files() -> None:
+    """Write out every queued type file with write_typescript_file, in parallel as the work is all IO."""
+    pending = list(_pending_typescript_files)
+    _pending_typescript_files.clear()
+
+    if not pending:
+        return
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Consume the results so any exception raised while writing is raised here.
+        list(executor.map(lambda kwargs: write_typescript_file(**kwargs), pending))